@@ -8,35 +8,116 @@ can be layered on elsewhere.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping as _MappingABC
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Iterable, List, Optional
+from enum import IntEnum
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 # --------------------------------------------------------------------------- #
 # Enumerations & helper functions                                              #
 # --------------------------------------------------------------------------- #
 
-class Ability(Enum):
-    """The six D&D-style ability scores."""
+class Ability(IntEnum):
+    """The six D&D-style ability scores.
 
-    STR = "STR"
-    DEX = "DEX"
-    CON = "CON"
-    INT = "INT"
-    WIS = "WIS"
-    CHA = "CHA"
+    Values double as indices into :attr:`Character.abilities`.
+    """
+
+    STR = 0
+    DEX = 1
+    CON = 2
+    INT = 3
+    WIS = 4
+    CHA = 5
 
     @classmethod
     def list(cls) -> List["Ability"]:
         """Return abilities in the canonical order (STR->CHA)."""
-        return [cls.STR, cls.DEX, cls.CON, cls.INT, cls.WIS, cls.CHA]
+        return list(cls)
+
+
+# Precomputed modifiers for scores -5..40: the legal 1-30 range plus headroom
+# for temporary penalties and bonuses. Indexed by ``score - _MIN_SCORE``;
+# anything outside falls back to the arithmetic.
+_MIN_SCORE = -5
+_MAX_SCORE = 40
+_MOD_TABLE: Tuple[int, ...] = tuple(
+    (s - 10) // 2 for s in range(_MIN_SCORE, _MAX_SCORE + 1)
+)
 
 
 def ability_modifier(score: int) -> int:
     """Return the standard D20 ability modifier for a raw *score*."""
+    if _MIN_SCORE <= score <= _MAX_SCORE:
+        return _MOD_TABLE[score - _MIN_SCORE]
     return (score - 10) // 2
 
 
+# Proficiency bonus by level (index 0 unused); levels past 20 fall back to math.
+_MAX_LEVEL = 20
+_PROF_BY_LEVEL: Tuple[int, ...] = tuple(
+    2 + (lv - 1) // 4 for lv in range(_MAX_LEVEL + 1)
+)
+
+
+# What Character accepts for *abilities*: scores in Ability order, or the
+# pre-IntEnum Dict[Ability, int] form. Reads always return a tuple.
+AbilityScores = Union[Sequence[int], Mapping[Ability, int]]
+
+
+def _coerce_scores(scores: AbilityScores) -> Tuple[int, ...]:
+    """Normalise *scores* to a tuple of six ints in Ability order.
+
+    Accepts any sequence indexed by :class:`Ability`, or a mapping keyed by
+    :class:`Ability` (the pre-IntEnum ``Dict[Ability, int]`` form).
+    """
+    if isinstance(scores, _MappingABC):
+        if len(scores) != len(Ability) or any(a not in scores for a in Ability):
+            raise ValueError(
+                "abilities mapping must have exactly one score per Ability, "
+                "keyed by Ability members (e.g. Ability.STR, not 'STR')"
+            )
+        values = tuple(scores[ability] for ability in Ability)
+    else:
+        values = tuple(scores)
+        if len(values) != len(Ability):
+            raise ValueError(f"abilities must have {len(Ability)} scores")
+    for value in values:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"ability scores must be int, got {value!r}")
+    return values
+
+
+class _AbilityScores:
+    """Descriptor behind :attr:`Character.abilities`.
+
+    Every assignment - constructor, :meth:`Character.set_ability` or plain
+    ``hero.abilities = ...`` - is validated and refreshes the cached
+    modifiers, so :meth:`Character.ability_mod` never sees stale scores.
+    """
+
+    def __get__(
+        self, obj: Optional["Character"], objtype: Optional[type] = None
+    ) -> Tuple[int, ...]:
+        if obj is None:
+            # dataclasses reads this as the field default.
+            return (10,) * len(Ability)
+        return obj._abilities
+
+    def __set__(self, obj: "Character", value: AbilityScores) -> None:
+        obj._abilities = _coerce_scores(value)
+        obj._sync_ability_mods()
+
+
 # --------------------------------------------------------------------------- #
 # Character dataclass                                                          #
 # --------------------------------------------------------------------------- #
@@ -54,15 +135,24 @@ class Character:
     race: str  # TODO: replace with enum or separate model when ready
     char_class: str  # TODO: replace with enum or separate model when ready
     level: int = 1
-    abilities: Dict[Ability, int] = field(
-        default_factory=lambda: {ability: 10 for ability in Ability}
-    )
+    # Raw scores indexed by Ability (STR->CHA). Accepts any AbilityScores on
+    # construction/assignment; reads return a tuple, so the scores can only
+    # change via assignment, which refreshes the cached modifiers.
+    abilities: _AbilityScores = _AbilityScores()
     max_hp: Optional[int] = None  # can be set once CON & hit die are finalised
 
     # Derived fields (computed in __post_init__). These are intentionally *not*
     # passed via constructor so we always stay consistent with *level*.
     proficiency_bonus: int = field(init=False)
 
+    if TYPE_CHECKING:
+        # Plain instance attributes set by _AbilityScores. At runtime they are
+        # not dataclass fields, so they stay out of repr/eq/asdict; declaring
+        # them as init=False fields here keeps type-checkers' dataclass
+        # plugins happy about field ordering.
+        _abilities: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+        _mods: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
     # --------------------------------------------------------------------- #
     # Lifecycle helpers                                                    #
     # --------------------------------------------------------------------- #
@@ -77,8 +167,14 @@ class Character:
     # --------------------------------------------------------------------- #
 
     def ability_mod(self, ability: Ability) -> int:
-        """Convenience wrapper around :func:`ability_modifier`."""
-        return ability_modifier(self.abilities[ability])
+        """Cached :func:`ability_modifier` for *ability*'s current score."""
+        return self._mods[ability]
+
+    def set_ability(self, ability: Ability, score: int) -> None:
+        """Set *ability* to *score*; the cached modifiers refresh automatically."""
+        scores = list(self.abilities)
+        scores[ability] = score
+        self.abilities = scores
 
     @property
     def initiative(self) -> int:
@@ -99,7 +195,15 @@ class Character:
 
     def _sync_proficiency_bonus(self) -> None:
         """Compute proficiency bonus from *level* (RAW 5e progression)."""
-        self.proficiency_bonus = 2 + (self.level - 1) // 4
+        level = self.level
+        if level <= _MAX_LEVEL:
+            self.proficiency_bonus = _PROF_BY_LEVEL[level]
+        else:
+            self.proficiency_bonus = 2 + (level - 1) // 4
+
+    def _sync_ability_mods(self) -> None:
+        """Recompute the cached ``_mods`` tuple from *abilities*."""
+        self._mods = tuple(ability_modifier(score) for score in self._abilities)
 
     # ------------------------------------------------------------------ #
     # Representation                                                     #
@@ -107,7 +211,7 @@ class Character:
 
     def __str__(self) -> str:  # pragma: no cover - human-friendly only
         abilities = ", ".join(
-            f"{abbr}:{self.abilities[abbr]}({self.ability_mod(abbr):+d})"
+            f"{abbr.name}:{self.abilities[abbr]}({self.ability_mod(abbr):+d})"
             for abbr in Ability.list()
         )
         return (
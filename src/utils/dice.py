@@ -1 +1,81 @@
-"""Utility for parsing and rolling dice expressions such as '2d6+3'."""
\ No newline at end of file
+"""Utility for parsing and rolling dice expressions such as '2d6+3'."""
+from __future__ import annotations
+
+import random
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+# --------------------------------------------------------------------------- #
+# Parsing                                                                      #
+# --------------------------------------------------------------------------- #
+
+# ``[count]d<sides>[+/-modifier]`` - whitespace is stripped before matching.
+_ROLL_RE = re.compile(r"(\d*)d(\d+)([+-]\d+)?")
+
+# Upper bounds on a single expression; far beyond any real roll, but they stop
+# a typo like "1000000000d6" from spinning in Dice.roll for minutes.
+_MAX_DICE = 1000
+_MAX_SIDES = 1000
+
+
+@lru_cache(maxsize=256)
+def _parse(expr: str) -> Tuple[int, int, int]:
+    """Return ``(count, sides, modifier)`` for a dice *expr*.
+
+    Parsing is lenient: whitespace is ignored and the ``d`` is
+    case-insensitive, so ``"D 20"`` and ``"2D6 + 3"`` are accepted. Counts
+    and sides must be between 1 and 1000.
+
+    Cached so the regex only runs once per distinct expression - combat
+    loops re-roll the same handful ("d20", "1d8+2") over and over.
+    """
+    match = _ROLL_RE.fullmatch("".join(expr.split()).lower())
+    if match is None:
+        raise ValueError(f"invalid dice expression: {expr!r}")
+    count_s, sides_s, mod_s = match.groups()
+    count = int(count_s) if count_s else 1
+    sides = int(sides_s)
+    if count < 1 or sides < 1:
+        raise ValueError(f"invalid dice expression: {expr!r}")
+    if count > _MAX_DICE or sides > _MAX_SIDES:
+        raise ValueError(
+            f"dice expression too large (max {_MAX_DICE}d{_MAX_SIDES}): {expr!r}"
+        )
+    return count, sides, int(mod_s) if mod_s else 0
+
+
+# --------------------------------------------------------------------------- #
+# Public API                                                                   #
+# --------------------------------------------------------------------------- #
+
+class Dice:
+    """Static dice roller - every random element in the game funnels through here."""
+
+    @staticmethod
+    def roll(expr: str) -> int:
+        """Roll *expr* (e.g. ``"2d6+3"``, ``"d20"``, ``"3d4-1"``) and return the total.
+
+        Raises :class:`ValueError` if *expr* is not valid dice notation.
+        """
+        count, sides, modifier = _parse(expr)
+        randrange = random.randrange
+        return sum(randrange(1, sides + 1) for _ in range(count)) + modifier
+
+    @staticmethod
+    def roll_many(expr: str, batch: int = 1) -> List[int]:
+        """Roll *expr* *batch* times and return each total.
+
+        Parses once and draws every die for the whole batch in a single
+        :func:`random.choices` call - handy for mass rolls such as hit
+        points for a horde of enemies. *batch* is capped at 1000, like the
+        dice count, which bounds the rolls list at a million entries.
+        """
+        if not 0 <= batch <= _MAX_DICE:
+            raise ValueError(f"batch must be between 0 and {_MAX_DICE}, got {batch}")
+        count, sides, modifier = _parse(expr)
+        rolls = random.choices(range(1, sides + 1), k=count * batch)
+        return [
+            sum(rolls[i:i + count]) + modifier
+            for i in range(0, len(rolls), count)
+        ]
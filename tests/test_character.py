@@ -0,0 +1,136 @@
+from dataclasses import asdict
+
+import pytest
+
+from src.models.character import Ability, Character, ability_modifier
+
+
+def make_character(**kwargs):
+    return Character(name="Lyra", race="Elf", char_class="Rogue", **kwargs)
+
+
+def test_default_abilities_have_zero_modifiers():
+    hero = make_character()
+    assert all(hero.ability_mod(ability) == 0 for ability in Ability)
+    assert hero.initiative == 0
+
+
+def test_ability_mod_and_initiative_follow_scores():
+    hero = make_character(abilities=(18, 14, 12, 8, 10, 3))
+    assert hero.ability_mod(Ability.STR) == 4
+    assert hero.ability_mod(Ability.CON) == 1
+    assert hero.ability_mod(Ability.INT) == -1
+    assert hero.ability_mod(Ability.CHA) == -4
+    assert hero.initiative == 2
+
+
+def test_set_ability_refreshes_modifier():
+    hero = make_character()
+    hero.set_ability(Ability.DEX, 16)
+    assert hero.abilities[Ability.DEX] == 16
+    assert hero.ability_mod(Ability.DEX) == 3
+    assert hero.initiative == 3
+
+
+def test_reassigning_abilities_refreshes_modifiers():
+    hero = make_character()
+    hero.abilities = [20, 10, 10, 10, 10, 10]
+    assert hero.abilities == (20, 10, 10, 10, 10, 10)
+    assert hero.ability_mod(Ability.STR) == 5
+
+
+def test_abilities_cannot_be_mutated_in_place():
+    hero = make_character()
+    with pytest.raises(TypeError):
+        hero.abilities[Ability.STR] = 20
+    assert hero.ability_mod(Ability.STR) == 0
+
+
+def test_cached_modifiers_are_not_dataclass_fields():
+    data = asdict(make_character())
+    assert "_mods" not in data
+    assert data["abilities"] == (10,) * 6
+
+
+def test_abilities_accept_mapping_keyed_by_ability():
+    scores = {Ability.STR: 18, Ability.DEX: 14, Ability.CON: 12,
+              Ability.INT: 10, Ability.WIS: 8, Ability.CHA: 16}
+    hero = make_character(abilities=scores)
+    assert hero.abilities == (18, 14, 12, 10, 8, 16)
+    assert hero.ability_mod(Ability.STR) == 4
+    assert hero.ability_mod(Ability.WIS) == -1
+
+
+def test_abilities_mapping_with_string_keys_is_rejected():
+    scores = {ability.name: 10 for ability in Ability}
+    with pytest.raises(ValueError):
+        make_character(abilities=scores)
+
+
+@pytest.mark.parametrize("scores", [[10] * 5, [10] * 7, ()])
+def test_wrong_length_abilities_raise(scores):
+    with pytest.raises(ValueError):
+        make_character(abilities=scores)
+
+
+@pytest.mark.parametrize("bad", ["10", 10.0, None, True])
+def test_non_int_scores_raise(bad):
+    with pytest.raises(TypeError):
+        make_character(abilities=[bad, 10, 10, 10, 10, 10])
+
+
+def test_set_ability_accepts_tuple_input():
+    hero = make_character(abilities=(10, 10, 10, 10, 10, 10))
+    hero.set_ability(Ability.CHA, 14)
+    assert hero.abilities == (10, 10, 10, 10, 10, 14)
+    assert hero.ability_mod(Ability.CHA) == 2
+
+
+def test_ability_is_int_indexed():
+    assert [int(ability) for ability in Ability.list()] == list(range(6))
+
+
+@pytest.mark.parametrize("score", range(-60, 61))
+def test_ability_modifier_matches_formula(score):
+    assert ability_modifier(score) == (score - 10) // 2
+
+
+@pytest.mark.parametrize("score, expected", [(-10, -10), (-6, -8), (41, 15), (100, 45)])
+def test_scores_outside_table_use_formula(score, expected):
+    hero = make_character(abilities=[score, 10, 10, 10, 10, 10])
+    assert hero.ability_mod(Ability.STR) == expected
+
+
+def test_proficiency_bonus_across_levels():
+    hero = make_character()
+    expected = {1: 2, 4: 2, 5: 3, 8: 3, 9: 4, 13: 5, 17: 6, 20: 6, 21: 7, 24: 7}
+    for level in range(1, 25):
+        assert hero.level == level
+        assert hero.proficiency_bonus == 2 + (level - 1) // 4
+        if level in expected:
+            assert hero.proficiency_bonus == expected[level]
+        hero.level_up()
+
+
+@pytest.mark.parametrize("level", [1, 20, 21, 24])
+def test_proficiency_bonus_from_constructor(level):
+    assert make_character(level=level).proficiency_bonus == 2 + (level - 1) // 4
+
+
+def test_level_below_one_raises():
+    with pytest.raises(ValueError):
+        make_character(level=0)
+
+
+def test_string_ability_values_no_longer_resolve():
+    # Ability values changed from "STR".. strings to 0..5 indices.
+    with pytest.raises(ValueError):
+        Ability("STR")
+    assert Ability["STR"] is Ability.STR
+    assert Ability.STR.value == 0
+
+
+def test_mapping_keyed_by_old_string_values_fails_clearly():
+    scores = {ability.name: 10 for ability in Ability}
+    with pytest.raises(ValueError, match="Ability.STR, not 'STR'"):
+        make_character(abilities=scores)
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from src.utils.dice import Dice
+
+
+@pytest.mark.parametrize(
+    "expr, lowest, highest",
+    [
+        ("d20", 1, 20),
+        ("2d6+3", 5, 15),
+        ("3d4-1", 2, 11),
+        ("D 20", 1, 20),
+        (" 2D6 + 3 ", 5, 15),
+        ("1000d1000", 1000, 1_000_000),
+    ],
+)
+def test_roll_parses_count_sides_and_modifier(monkeypatch, expr, lowest, highest):
+    monkeypatch.setattr(random, "randrange", lambda start, stop: start)
+    assert Dice.roll(expr) == lowest
+    monkeypatch.setattr(random, "randrange", lambda start, stop: stop - 1)
+    assert Dice.roll(expr) == highest
+
+
+@pytest.mark.parametrize(
+    "expr", ["0d6", "d0", "1d6+", "abc", "", "2d", "1001d6", "d1001", "1000000000d6"]
+)
+def test_roll_rejects_invalid_expressions(expr):
+    with pytest.raises(ValueError):
+        Dice.roll(expr)
+
+
+@pytest.mark.parametrize(
+    "expr, low, high",
+    [("d20", 1, 20), ("2d6+3", 5, 15), ("3d4-1", 2, 11)],
+)
+def test_roll_stays_within_bounds(expr, low, high):
+    random.seed(1234)
+    totals = {Dice.roll(expr) for _ in range(500)}
+    assert min(totals) >= low
+    assert max(totals) <= high
+
+
+def test_roll_is_reproducible_with_seed():
+    random.seed(42)
+    first = [Dice.roll("2d6+3") for _ in range(10)]
+    random.seed(42)
+    assert [Dice.roll("2d6+3") for _ in range(10)] == first
+
+
+def test_roll_many_returns_one_total_per_batch():
+    random.seed(7)
+    totals = Dice.roll_many("8d6", 200)
+    assert len(totals) == 200
+    assert all(8 <= total <= 48 for total in totals)
+
+
+def test_roll_many_applies_modifier():
+    random.seed(7)
+    assert all(2 <= total <= 5 for total in Dice.roll_many("1d4+1", 100))
+
+
+def test_roll_many_empty_batch():
+    assert Dice.roll_many("2d6", 0) == []
+
+
+def test_roll_many_sums_each_chunk_with_modifier(monkeypatch):
+    def fake_choices(population, k):
+        assert list(population) == [1, 2, 3, 4, 5, 6]
+        assert k == 6
+        return [1, 2, 3, 4, 5, 6]
+
+    monkeypatch.setattr(random, "choices", fake_choices)
+    assert Dice.roll_many("2d6+1", 3) == [4, 8, 12]
+
+
+def test_roll_many_applies_negative_modifier_once_per_total(monkeypatch):
+    monkeypatch.setattr(random, "choices", lambda population, k: [4] * k)
+    assert Dice.roll_many("3d4-2", 2) == [10, 10]
+
+
+@pytest.mark.parametrize("batch", [-1, -10, 1001])
+def test_roll_many_rejects_out_of_range_batch(batch):
+    with pytest.raises(ValueError):
+        Dice.roll_many("2d6", batch)
+
+
+def test_roll_many_rejects_invalid_expression():
+    with pytest.raises(ValueError):
+        Dice.roll_many("0d6", 3)